@@ -1,44 +1,266 @@
+from array import array
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import glob
+import os
+
+from index import NEONameIndex
 from models import OrbitPath, NearEarthObject
+from views import NEOViews
 import pandas as pd
 
+
+class NEOPartition(object):
+    """
+    Object holding the Near Earth Objects and orbits loaded from a single csv file, along with the span of
+    orbit dates the file covers so searches can skip the partitions outside of the searched dates.
+
+    Once merged into the database, the orbit dates map to the positions of the Near Earth Objects in the
+    NEODatabase.neos store rather than to the NearEarthObject instances.
+    """
+
+    def __init__(self, filename, orbitdate_neo_mapping, neoname_neo_mapping):
+        """
+        :param filename: str representing the pathway of the csv file the partition was loaded from
+        :param orbitdate_neo_mapping: dict of orbit date, in days since 1970-01-01, to list of NearEarthObject instances
+        :param neoname_neo_mapping: dict of Near Earth Object name to NearEarthObject instance
+        """
+        self.filename = filename
+        self.orbitdate_neo_mapping = orbitdate_neo_mapping
+        self.neoname_neo_mapping = neoname_neo_mapping
+        self.start_date = min(orbitdate_neo_mapping) if orbitdate_neo_mapping else None
+        self.end_date = max(orbitdate_neo_mapping) if orbitdate_neo_mapping else None
+
+    def overlaps(self, start_date, end_date):
+        """
+        :param start_date: int representing the first searched date in days since 1970-01-01
+        :param end_date: int representing the last searched date in days since 1970-01-01
+        :return: bool representing if the partition holds orbits between start_date and end_date
+        """
+        if self.start_date is None:
+            return False
+        return self.start_date <= end_date and start_date <= self.end_date
+
+    def merge_into(self, neos, positions):
+        """
+        Merges the Near Earth Objects of the partition into the database store, a Near Earth Object already in the
+        store from another partition taking the orbits of this partition.
+
+        :param neos: list of the unique NearEarthObject instances of the database, appended to
+        :param positions: dict of Near Earth Object name to position in neos, updated
+        :return: None
+        """
+        for name, neo in self.neoname_neo_mapping.items():
+            if name in positions:
+                neos[positions[name]].extend_orbits(neo.orbits)
+            else:
+                positions[name] = len(neos)
+                neos.append(neo)
+
+        self.neoname_neo_mapping = {name: neos[positions[name]] for name in self.neoname_neo_mapping}
+        self.orbitdate_neo_mapping = {
+            date: array('I', [positions[neo.name] for neo in date_neos])
+            for date, date_neos in self.orbitdate_neo_mapping.items()
+        }
+
+
+class NEOSnapshot(object):
+    """
+    Object holding every index of the Near Earth Objects loaded by one NEODatabase.load_data call.
+
+    A snapshot is fully built before the database publishes it and is never modified afterwards, so a search
+    holding a snapshot sees a consistent state, without taking any lock, while a reload builds the next one.
+    """
+
+    def __init__(self, partitions=(), materialized_views=True):
+        """
+        :param partitions: list of NEOPartition loaded from the csv files
+        :param materialized_views: bool representing if the NEOViews are precomputed
+        """
+        neos = []
+        positions = {}
+        orbitdate_neo_mapping = {}
+        for partition in partitions:
+            partition.merge_into(neos, positions)
+            for date, date_positions in partition.orbitdate_neo_mapping.items():
+                orbitdate_neo_mapping.setdefault(date, array('I')).extend(date_positions)
+
+        self.neos = neos
+        self.orbitdate_neo_mapping = orbitdate_neo_mapping
+        self.neoname_neo_mapping = {name: neos[position] for name, position in positions.items()}
+        self.name_index = NEONameIndex(neos)
+        self.partitions = list(partitions)
+        self.views = NEOViews(neos) if materialized_views else None
+
+    def get_partitions(self, start_date, end_date):
+        """
+        :param start_date: int representing the first searched date in days since 1970-01-01
+        :param end_date: int representing the last searched date in days since 1970-01-01
+        :return: list of NEOPartition holding orbits between start_date and end_date
+        """
+        return [partition for partition in self.partitions if partition.overlaps(start_date, end_date)]
+
+    def get_neo_object(self, name):
+        return self.neoname_neo_mapping[name]
+
+
 class NEODatabase(object):
     """
     Object to hold Near Earth Objects and their orbits.
 
-    To support optimized date searching, a dict mapping of all orbit date paths to the Near Earth Objects
-    recorded on a given day is maintained. Additionally, all unique instances of a Near Earth Object
-    are contained in a dict mapping the Near Earth Object name to the NearEarthObject instance.
+    All unique instances of a Near Earth Object are held in the neos store. To support optimized date searching,
+    a dict mapping of all orbit date paths, in days since 1970-01-01, to the positions in the store of the Near
+    Earth Objects recorded on a given day is maintained. Additionally, all unique instances of a Near Earth Object
+    are contained in a dict mapping the Near Earth Object name to the NearEarthObject instance, and a
+    NEONameIndex supports searching them by name, name prefix or id.
+
+    The data may be spread over several csv files, e.g. one per year, which are loaded concurrently into one
+    NEOPartition each. A Near Earth Object seen in several files is kept as a single instance.
+
+    Unless disabled, NEOViews materialized views answering the standard README queries are rebuilt on every load.
+
+    All of these are held by an immutable NEOSnapshot: a reload builds a new snapshot off to the side and swaps it
+    in with a single assignment, so the database can be searched from several threads while it reloads.
     """
 
-    def __init__(self, filename):
+    def __init__(self, filename, materialized_views=True):
         """
-        :param filename: str representing the pathway of the filename containing the Near Earth Object data
+        :param filename: str representing the pathway of the filename containing the Near Earth Object data,
+                         a directory of csv files or a glob pattern, or a list of those
+        :param materialized_views: bool representing if load_data precomputes the NEOViews
         """
         # TODO: What data structures will be needed to store the NearEarthObjects and OrbitPaths?
         # TODO: Add relevant instance variables for this.
-        self.orbitdate_neo_mapping = {}
-        self.neoname_neo_mapping = {}
+        self.materialized_views = materialized_views
+        self.snapshot = NEOSnapshot(materialized_views=materialized_views)
         self.filename = filename
 
+    @property
+    def neos(self):
+        return self.snapshot.neos
+
+    @property
+    def orbitdate_neo_mapping(self):
+        return self.snapshot.orbitdate_neo_mapping
+
+    @property
+    def neoname_neo_mapping(self):
+        return self.snapshot.neoname_neo_mapping
+
+    @property
+    def name_index(self):
+        return self.snapshot.name_index
+
+    @property
+    def partitions(self):
+        return self.snapshot.partitions
+
+    @property
+    def views(self):
+        return self.snapshot.views
+
+    @staticmethod
+    def get_filenames(filename):
+        """
+        Expands the filename provided to the database into the csv files to load
+
+        :param filename: str representing a csv file, a directory of csv files or a glob pattern, or a list of those
+        :return: list of str representing the pathways of the csv files
+        """
+        if isinstance(filename, (list, tuple)):
+            return [each for pattern in filename for each in NEODatabase.get_filenames(pattern)]
+
+        if os.path.isdir(filename):
+            filenames = sorted(glob.glob(os.path.join(filename, '*.csv')))
+        elif glob.has_magic(filename):
+            filenames = sorted(glob.glob(filename))
+        else:
+            return [filename]
+
+        if not filenames:
+            raise FileNotFoundError(f'No csv files found for {filename}')
+        return filenames
 
     def load_data(self, filename=None):
         """
-        Loads data from a .csv file, instantiating Near Earth Objects and their OrbitPaths by:
-           - Storing a dict of orbit date to list of NearEarthObject instances
+        Loads data from one or more .csv files, instantiating Near Earth Objects and their OrbitPaths by:
+           - Storing a list of the unique NearEarthObject instances
+           - Storing a dict of orbit date to array of positions in the list of NearEarthObject instances
            - Storing a dict of the Near Earth Object name to the single instance of NearEarthObject
+           - Storing a NEONameIndex of the Near Earth Objects names and ids
+           - Storing a NEOPartition for every .csv file loaded
+           - Storing the NEOViews materialized views, if enabled
+
+        The files are loaded in a thread pool driven by an asyncio event loop. When called from a running event
+        loop, e.g. in an async web host, the loading runs in a helper thread with its own event loop and blocks
+        the caller; await load_data_async instead to keep the running loop serving.
 
         :param filename:
         :return:
         """
 
+        filenames = self.get_filenames(self.get_filename(filename))
+
+        # TODO: Load data from csv file.
+        # TODO: Where will the data be stored?
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            partitions = asyncio.run(self.load_partitions(filenames))
+        else:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                partitions = executor.submit(asyncio.run, self.load_partitions(filenames)).result()
+
+        # Published with a single assignment so searches never see a half built snapshot
+        self.snapshot = NEOSnapshot(partitions, self.materialized_views)
+
+        return None
+
+    async def load_data_async(self, filename=None):
+        """
+        Loads data like load_data, awaiting the loading of the .csv files on the running event loop
+
+        :param filename: str representing the csv files to load, see get_filenames, defaults to the database filename
+        :return: None
+        """
+        partitions = await self.load_partitions(self.get_filenames(self.get_filename(filename)))
+        self.snapshot = NEOSnapshot(partitions, self.materialized_views)
+
+    def get_filename(self, filename=None):
+        """
+        :param filename: str representing the csv files to load, see get_filenames
+        :return: the filename provided, or the database filename if none is
+        """
         if not (filename or self.filename):
             raise Exception('Cannot load data, no filename provided')
 
-        filename = filename or self.filename
+        return filename or self.filename
 
-        # TODO: Load data from csv file.
-        # TODO: Where will the data be stored?
+    async def load_partitions(self, filenames):
+        """
+        Loads every .csv file into a NEOPartition, concurrently in a pool of threads
+
+        :param filenames: list of str representing the pathways of the csv files
+        :return: list of NEOPartition in the order of filenames
+        """
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=min(len(filenames), os.cpu_count() or 1)) as executor:
+            return await asyncio.gather(
+                *(loop.run_in_executor(executor, self.load_partition, filename) for filename in filenames)
+            )
+
+    def load_partition(self, filename):
+        """
+        Loads data from a single .csv file into a NEOPartition
+
+        :param filename: str representing the pathway of the csv file
+        :return: NEOPartition
+        """
         df  = pd.read_csv(filename)
+        # Orbit dates are kept as days since 1970-01-01 so date searches compare integers
+        df['close_approach_date'] = (
+            pd.to_datetime(df['close_approach_date'], format='%Y-%m-%d') - pd.Timestamp(0)
+        ).dt.days
         df_sub = df[['id', 'name', 'nasa_jpl_url',\
                                'absolute_magnitude_h', 'estimated_diameter_min_kilometers',\
                                'close_approach_date', 'miss_distance_kilometers', 'is_potentially_hazardous_asteroid']]
@@ -60,15 +282,23 @@ class NEODatabase(object):
         df_res['neo_object_v2'] = df_res[['neo_object_v1', 'orbit_part_v1']].apply(self.final_neo_object, axis = 1)
         df_final = pd.merge(df, df_res, on='name')
 
-        self.orbitdate_neo_mapping = df_final.groupby(['close_approach_date'])['neo_object_v2'].apply(list).to_dict()
-        self.neoname_neo_mapping = df_res.groupby(['name'])['neo_object_v2'].first().to_dict()
+        return NEOPartition(
+            filename,
+            df_final.groupby(['close_approach_date'])['neo_object_v2'].apply(list).to_dict(),
+            df_res.groupby(['name'])['neo_object_v2'].first().to_dict()
+        )
 
-        return None
+    def get_partitions(self, start_date, end_date):
+        """
+        :param start_date: int representing the first searched date in days since 1970-01-01
+        :param end_date: int representing the last searched date in days since 1970-01-01
+        :return: list of NEOPartition holding orbits between start_date and end_date
+        """
+        return self.snapshot.get_partitions(start_date, end_date)
 
     def final_neo_object(self, val):
         neo_object_v1, orbit_part_v1 = val
-        for each in orbit_part_v1:
-            neo_object_v1.update_orbits(each)
+        neo_object_v1.extend_orbits(orbit_part_v1)
 
         return neo_object_v1
 
@@ -77,7 +307,7 @@ class NEODatabase(object):
         Generates Neo object from every record of the csv file
         """
         id_, name, nasa_jpl_url, absolute_magnitude_h, estimated_diameter_min_kilometers, close_approach_date, miss_distance_kilometers, is_potentially_hazardous_asteroid = val
-        neo = NearEarthObject(id_ = id_, \
+        neo = NearEarthObject(id = id_, \
                           name = name, \
                           nasa_jpl_url = nasa_jpl_url, \
                           absolute_magnitude_h = absolute_magnitude_h, \
@@ -98,4 +328,4 @@ class NEODatabase(object):
 
 
     def get_neo_object(self, name):
-        return self.neoname_neo_mapping[name]
+        return self.snapshot.get_neo_object(name)
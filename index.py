@@ -0,0 +1,91 @@
+from bisect import bisect_left
+
+
+class NEONameIndex(object):
+    """
+    Object indexing the Near Earth Objects by name and by id.
+
+    Exact names and ids are looked up in dicts, independently of the number of Near Earth Objects. Name prefixes,
+    e.g. every "(2019 " designation, are searched with a binary search over the sorted names followed by a scan
+    of the matching names only.
+    """
+
+    def __init__(self, neos):
+        """
+        :param neos: list of unique NearEarthObject instances to index, the store of the database
+        """
+        self.neos = neos
+        self.name_position_mapping = {}
+        self.id_position_mapping = {}
+        for position, neo in enumerate(neos):
+            self.name_position_mapping[neo.name] = position
+            if getattr(neo, 'id', None) is not None:
+                self.id_position_mapping[int(neo.id)] = position
+        self.names = sorted(self.name_position_mapping)
+
+    def get_by_name(self, name):
+        """
+        :param name: str representing the exact name of a Near Earth Object
+        :return: NearEarthObject or None if no Near Earth Object has that name
+        """
+        position = self.name_position_mapping.get(name)
+        return None if position is None else self.neos[position]
+
+    def get_by_id(self, id_):
+        """
+        :param id_: int or str representing the id of a Near Earth Object
+        :return: NearEarthObject or None if no Near Earth Object has that id
+        """
+        position = self.id_position_mapping.get(int(id_))
+        return None if position is None else self.neos[position]
+
+    def search_prefix(self, prefix):
+        """
+        :param prefix: str representing the beginning of Near Earth Object names
+        :return: list of NearEarthObject whose name starts with prefix, sorted by name
+        """
+        return [self.neos[position] for position in self.prefix_positions(prefix)]
+
+    def prefix_positions(self, prefix):
+        """
+        :param prefix: str representing the beginning of Near Earth Object names
+        :return: list of the positions of the Near Earth Objects whose name starts with prefix, sorted by name
+        """
+        positions = []
+        for name_position in range(bisect_left(self.names, prefix), len(self.names)):
+            name = self.names[name_position]
+            if not name.startswith(prefix):
+                break
+            positions.append(self.name_position_mapping[name])
+        return positions
+
+    def positions(self, names=None, prefixes=None, ids=None):
+        """
+        Batched lookup of the positions of Near Earth Objects by exact name, by name prefix and by id
+
+        :param names: list of str representing exact Near Earth Object names
+        :param prefixes: list of str representing beginnings of Near Earth Object names
+        :param ids: list of int or str representing Near Earth Object ids
+        :return: list of the unique positions found, in the order they were asked for
+        """
+        positions = {}
+        for name in names or []:
+            if name in self.name_position_mapping:
+                positions[self.name_position_mapping[name]] = None
+        for prefix in prefixes or []:
+            positions.update(dict.fromkeys(self.prefix_positions(prefix)))
+        for id_ in ids or []:
+            if int(id_) in self.id_position_mapping:
+                positions[self.id_position_mapping[int(id_)]] = None
+        return list(positions)
+
+    def lookup(self, names=None, prefixes=None, ids=None):
+        """
+        Batched lookup of Near Earth Objects by exact name, by name prefix and by id
+
+        :param names: list of str representing exact Near Earth Object names
+        :param prefixes: list of str representing beginnings of Near Earth Object names
+        :param ids: list of int or str representing Near Earth Object ids
+        :return: list of the unique NearEarthObject found, in the order they were asked for
+        """
+        return [self.neos[position] for position in self.positions(names, prefixes, ids)]
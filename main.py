@@ -11,6 +11,8 @@ Search options:
 - Find N NEOs by date e.g. main.py display --return NEO -n 10 -d 2020-01-10
 - Find N NEOs between start_date and end_date  e.g. main.py display --return NEO -n 10 --start_date 2020-01-01 --end_date 2020-01-10
 - Find N NEOs between start_date and end_date with filters and output to csvfile with name 'neo_neo_data' e.g. csvfile -n 10 -f new_neo_data --start_date 2020-01-01 --end_date 2020-01-10 --filter "is_hazardous:=:False" "diameter:>:0.02" "distance:>=:50000
+- Find NEOs by name, name prefix or id e.g. main.py display --name "433 Eros (A898 PA)" "(2019*" --id 3542519
+- Find the N closest NEOs between start_date and end_date e.g. main.py display -n 10 --start_date 2020-01-01 --end_date 2020-01-10 --order distance
 
 Output options: Required.
 - display: prints to stdout
@@ -25,7 +27,13 @@ Return objects options: Optional, defaults to NEO if not specified.
 - NEO
 - Path
 
+Order options: Optional. Input as: option or option:direction e.g. distance or diameter:desc
+- distance
+- diameter
+- date
+
 Filename: Optional, used for specifying a filename for a csv to load data from. By default project looks for a csv in: data/neo_data.csv.
+Several csv files, a directory of csv files or a glob pattern e.g. "data/neo_*.csv" may be given, they are loaded concurrently.
 """
 
 import argparse
@@ -35,7 +43,7 @@ from datetime import datetime
 
 from exceptions import UnsupportedFeature
 from database import NEODatabase
-from search import Query, NEOSearcher
+from search import Query, NEOSearcher, Order
 from writer import OutputFormat, NEOWriter
 
 PROJECT_ROOT = pathlib.Path(__file__).parent.absolute()
@@ -56,6 +64,22 @@ def verify_date(datetime_str):
         raise argparse.ArgumentTypeError(error_message)
 
 
+def verify_order_choice(choice):
+    """
+    Function that verifies order choice is a supported Order option.
+
+    :param choice:    String representing an Order option with an optional direction
+    :return: str:     String representing an Order option with an optional direction
+    """
+    try:
+        Order.create_order(choice)
+    except UnsupportedFeature:
+        error_message = f'Not a valid order option: "{choice}"'
+        raise argparse.ArgumentTypeError(error_message)
+
+    return choice
+
+
 def verify_output_choice(choice):
     """
     Function that verifies output choice is a supported OutputFormat.
@@ -85,13 +109,21 @@ if __name__ == '__main__':
     parser.add_argument('-e', '--end_date', type=verify_date,
                         help='YYYY-MM-DD format to find NEOs up to the end date')
     parser.add_argument('-n', '--number', type=int, help='Int representing max number of NEOs to return')
-    parser.add_argument('-f', '--filename', type=str, help='Name of input csv data file')
+    parser.add_argument('-f', '--filename', nargs='+', type=str,
+                        help='Name of input csv data files, directories of csv files or glob patterns')
     parser.add_argument('--filter', nargs='+', help='Select filter options with filter value: '
                                                     'is_hazardous:[=]:bool, '
                                                     'diameter:[>=|=|<=]:float, '
                                                     'distance:[>=|=|<=]:float.'
                                                     'Input as: [option:operation:value] '
                                                     'e.g. diameter:>=:0.042')
+    parser.add_argument('--name', nargs='+', type=str,
+                        help='Names of NEOs to find, a name ending with * finds every name with that prefix '
+                             'e.g. "(2019*"')
+    parser.add_argument('--id', nargs='+', type=int, help='Ids of NEOs to find')
+    parser.add_argument('-o', '--order', type=verify_order_choice,
+                        help='Select option to order the results by: distance, diameter or date. '
+                             'Input as: [option] or [option:direction] e.g. diameter:desc')
 
     args = parser.parse_args()
     var_args = vars(args)
@@ -107,7 +139,7 @@ if __name__ == '__main__':
     try:
         db.load_data()
     except FileNotFoundError as e:
-        print(f'File {var_args.get("filename")} not found, please try another file name.')
+        print(f'File {" ".join(var_args.get("filename") or [filename])} not found, please try another file name.')
         sys.exit()
     except Exception as e:
         print(Exception)
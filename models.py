@@ -1,7 +1,40 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+import sys
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def date_to_day(date_str):
+    """
+    Function that encodes a date string into the number of days since 1970-01-01, the representation of orbit
+    dates used by the database and searches.
+
+    :param date_str: str representing a date in YYYY-MM-DD format
+    :return: int representing the number of days since 1970-01-01
+    """
+    return datetime.strptime(date_str, "%Y-%m-%d").toordinal() - EPOCH_ORDINAL
+
+
+def day_to_date(day):
+    """
+    Function that decodes a number of days since 1970-01-01 back into a date string for output.
+
+    :param day: int representing the number of days since 1970-01-01
+    :return: str representing the date in YYYY-MM-DD format
+    """
+    return date.fromordinal(day + EPOCH_ORDINAL).isoformat()
+
+
 class NearEarthObject(object):
     """
     Object containing data describing a Near Earth Object and it's orbits.
 
+    The orbits are kept as parallel arrays of close approach dates, in days since 1970-01-01, and miss distances,
+    sorted by date, with the minimum and maximum miss distance of all the orbits precomputed. Approaches within a
+    window of dates are found with a binary search on the dates.
+
     # TODO: You may be adding instance methods to NearEarthObject to help you implement search and output data.
     """
 
@@ -15,7 +48,7 @@ class NearEarthObject(object):
             if key == 'id':
                 self.id = value
             elif key == 'name':
-                self.name = value
+                self.name = sys.intern(value) if isinstance(value, str) else value
             elif key == 'nasa_jpl_url':
                 self.nasa_jpl_url = value
             elif key == 'absolute_magnitude_h':
@@ -24,7 +57,17 @@ class NearEarthObject(object):
                 self.diameter_min_km = value
             elif key == 'is_potentially_hazardous_asteroid':
                 self.is_potentially_hazardous_asteroid = value
-        self.orbits = []
+        self.approach_dates = array('i')
+        self.approach_distances = array('d')
+        self.min_miss_distance = None
+        self.max_miss_distance = None
+
+    @property
+    def orbits(self):
+        """
+        :return: list of every OrbitPath of the Near Earth Object, sorted by close approach date, built on every read
+        """
+        return self.approaches()
 
     def update_orbits(self, orbit):
         """
@@ -34,7 +77,106 @@ class NearEarthObject(object):
         :return: None
         """
         # TODO: How do we connect orbits back to the Near Earth Object?
-        self.orbits.append(orbit)
+        position = bisect_right(self.approach_dates, orbit.close_approach_date)
+        self.approach_dates.insert(position, orbit.close_approach_date)
+        self.approach_distances.insert(position, orbit.miss_distance_kilometers)
+        if self.min_miss_distance is None or orbit.miss_distance_kilometers < self.min_miss_distance:
+            self.min_miss_distance = orbit.miss_distance_kilometers
+        if self.max_miss_distance is None or orbit.miss_distance_kilometers > self.max_miss_distance:
+            self.max_miss_distance = orbit.miss_distance_kilometers
+
+    def extend_orbits(self, orbits):
+        """
+        Adds the information of several orbit paths to a Near Earth Object list of orbits, sorting them once
+
+        :param orbits: iterable of OrbitPath
+        :return: None
+        """
+        approaches = list(zip(self.approach_dates, self.approach_distances))
+        approaches.extend((orbit.close_approach_date, orbit.miss_distance_kilometers) for orbit in orbits)
+        approaches.sort()
+        self.approach_dates = array('i', [approach_date for approach_date, distance in approaches])
+        self.approach_distances = array('d', [distance for approach_date, distance in approaches])
+        self.update_miss_distances()
+
+    def update_miss_distances(self):
+        """
+        Recomputes the minimum and maximum miss distance of all the orbits of the Near Earth Object
+
+        :return: None
+        """
+        if self.approach_distances:
+            self.min_miss_distance = min(self.approach_distances)
+            self.max_miss_distance = max(self.approach_distances)
+
+    def approach_bounds(self, start_date=None, end_date=None):
+        """
+        :param start_date: int representing the first date of the window in days since 1970-01-01, None for no bound
+        :param end_date: int representing the last date of the window in days since 1970-01-01, None for no bound
+        :return: tuple of the first and past the last positions in the orbit arrays of the approaches in the window
+        """
+        start = 0 if start_date is None else bisect_left(self.approach_dates, start_date)
+        end = len(self.approach_dates) if end_date is None else bisect_right(self.approach_dates, end_date)
+        return start, max(start, end)
+
+    def approach_distances_between(self, start_date=None, end_date=None):
+        """
+        :param start_date: int representing the first date of the window in days since 1970-01-01, None for no bound
+        :param end_date: int representing the last date of the window in days since 1970-01-01, None for no bound
+        :return: memoryview of the miss distances of the approaches in the window, sorted by date
+        """
+        start, end = self.approach_bounds(start_date, end_date)
+        return memoryview(self.approach_distances)[start:end]
+
+    def approaches(self, start_date=None, end_date=None):
+        """
+        :param start_date: int representing the first date of the window in days since 1970-01-01, None for no bound
+        :param end_date: int representing the last date of the window in days since 1970-01-01, None for no bound
+        :return: list of OrbitPath of the approaches in the window, sorted by close approach date
+        """
+        return list(self.iter_approaches(start_date, end_date))
+
+    def iter_approaches(self, start_date=None, end_date=None):
+        """
+        :param start_date: int representing the first date of the window in days since 1970-01-01, None for no bound
+        :param end_date: int representing the last date of the window in days since 1970-01-01, None for no bound
+        :return: iterator building an OrbitPath for each approach in the window as it is read, sorted by date
+        """
+        start, end = self.approach_bounds(start_date, end_date)
+        for position in range(start, end):
+            yield OrbitPath(name=self.name, miss_distance_kilometers=self.approach_distances[position],
+                            close_approach_date=self.approach_dates[position])
+
+    def has_approach(self, start_date=None, end_date=None):
+        """
+        :param start_date: int representing the first date of the window in days since 1970-01-01, None for no bound
+        :param end_date: int representing the last date of the window in days since 1970-01-01, None for no bound
+        :return: bool representing if the Near Earth Object approaches Earth in the window
+        """
+        start, end = self.approach_bounds(start_date, end_date)
+        return start < end
+
+    def min_distance(self, start_date=None, end_date=None):
+        """
+        :param start_date: int representing the first date of the window in days since 1970-01-01, None for no bound
+        :param end_date: int representing the last date of the window in days since 1970-01-01, None for no bound
+        :return: float representing the minimum miss distance of the approaches in the window, None if there are none
+        """
+        if start_date is None and end_date is None:
+            return self.min_miss_distance
+        distances = self.approach_distances_between(start_date, end_date)
+        return min(distances) if distances else None
+
+    def max_distance(self, start_date=None, end_date=None):
+        """
+        :param start_date: int representing the first date of the window in days since 1970-01-01, None for no bound
+        :param end_date: int representing the last date of the window in days since 1970-01-01, None for no bound
+        :return: float representing the maximum miss distance of the approaches in the window, None if there are none
+        """
+        if start_date is None and end_date is None:
+            return self.max_miss_distance
+        distances = self.approach_distances_between(start_date, end_date)
+        return max(distances) if distances else None
 
     def __str__(self):
         print(type(str(self.is_potentially_hazardous_asteroid)))
@@ -61,17 +203,17 @@ class OrbitPath(object):
         :param kwargs:    dict of attributes about a given orbit, only a subset of attributes used
         """
         # TODO: What instance variables will be useful for storing on the Near Earth Object?
-        #name, miss distance in km, and orbit date
+        #name, miss distance in km, and orbit date as days since 1970-01-01
         for key, value in kwargs.items():
             if key == 'name':
-                self.neo_name = value
+                self.neo_name = sys.intern(value) if isinstance(value, str) else value
             elif key == 'miss_distance_kilometers':
                 self.miss_distance_kilometers = value
             elif key == 'close_approach_date':
-                self.close_approach_date = value
+                self.close_approach_date = int(value)
 
     def __str__(self):
         message = 'Name: ' + self.neo_name \
                  + ', Miss_Distance_Kilometers: ' + str(self.miss_distance_kilometers) \
-                 + ', Close_Approach_Date: ' + str(self.close_approach_date)
+                 + ', Close_Approach_Date: ' + day_to_date(self.close_approach_date)
         return message
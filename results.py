@@ -0,0 +1,138 @@
+from array import array
+from itertools import islice
+
+
+class NEOResultSet(object):
+    """
+    Object representing the results of a search as a selection of positions into the NearEarthObject store of
+    the database, rather than a list of the NearEarthObject instances themselves.
+
+    Path results are the approaches of the selected NearEarthObjects between start_date and end_date.
+
+    The candidate positions found by a search are narrowed by the filter predicates without being copied. They
+    are only resolved, once, when the results are first read: each candidate is checked against the predicates,
+    repeated candidates are dropped and resolving stops once the requested number of results is found, so the
+    only memory allocated is the selection of the final results.
+    """
+
+    def __init__(self, store, candidates, return_object='NEO', start_date=None, end_date=None):
+        """
+        :param store: list of NearEarthObject instances held by the database
+        :param candidates: iterable of int positions into the store found by a search, possibly repeated
+        :param return_object: str representing the returned entity, 'NEO' or 'Path'
+        :param start_date: int representing the first searched date in days since 1970-01-01, None for every date
+        :param end_date: int representing the last searched date in days since 1970-01-01, None for every date
+        """
+        self.store = store
+        self.candidates = candidates
+        self.return_object = return_object
+        self.start_date = start_date
+        self.end_date = end_date
+        self.predicates = []
+        self.number = None
+        self._selection = None
+
+    def narrow(self, predicate):
+        """
+        Function that restricts the results to the NearEarthObjects satisfying a predicate
+
+        :param predicate: function mapping a NearEarthObject to a bool
+        :return: NEOResultSet
+        """
+        self.predicates.append(predicate)
+        return self
+
+    def limit(self, number):
+        """
+        Function that restricts the results to their first number NearEarthObjects, or OrbitPaths
+
+        :param number: int representing max number of results to return, None to return all of them
+        :return: NEOResultSet
+        """
+        self.number = number
+        return self
+
+    def stream(self):
+        """
+        Function that walks the unique candidates satisfying every predicate without keeping a selection, for
+        consumers keeping only some of the results such as a bounded heap. The approaches of a Path result are
+        only built the first time its NearEarthObject is found, so each one is built once.
+
+        :return: iterator over the NearEarthObjects, or OrbitPaths, of the results
+        """
+        candidates, self.candidates = self.candidates, None
+        seen = set()
+        for position in candidates:
+            if position in seen:
+                continue
+            seen.add(position)
+            neo = self.store[position]
+            if all(predicate(neo) for predicate in self.predicates):
+                if self.return_object == 'NEO':
+                    yield neo
+                else:
+                    yield from neo.iter_approaches(self.start_date, self.end_date)
+
+    @property
+    def selection(self):
+        """
+        :return: array of the positions in the store of the NearEarthObjects of the results
+        """
+        if self._selection is None:
+            self._selection = self.resolve()
+        return self._selection
+
+    def resolve(self):
+        """
+        Function that walks the candidates, keeping the unique positions satisfying every predicate until the
+        requested number of results is reached
+
+        :return: array of the positions in the store of the NearEarthObjects of the results
+        """
+        selection = array('I')
+        seen = set()
+        count = 0
+        for position in self.candidates:
+            if self.number is not None and count >= self.number:
+                break
+            if position in seen:
+                continue
+            neo = self.store[position]
+            if all(predicate(neo) for predicate in self.predicates):
+                seen.add(position)
+                selection.append(position)
+                count += 1 if self.return_object == 'NEO' else self.approach_count(neo)
+        self.candidates = None
+        return selection
+
+    def approach_count(self, neo):
+        """
+        :param neo: NearEarthObject of the results
+        :return: int representing the number of approaches of the Near Earth Object between the searched dates
+        """
+        start, end = neo.approach_bounds(self.start_date, self.end_date)
+        return end - start
+
+    def neos(self):
+        """
+        :return: iterator over the NearEarthObjects of the results
+        """
+        store = self.store
+        return (store[position] for position in self.selection)
+
+    def __iter__(self):
+        if self.return_object == 'NEO':
+            return self.neos()
+        orbits = (orbit for neo in self.neos() for orbit in neo.iter_approaches(self.start_date, self.end_date))
+        return islice(orbits, self.number)
+
+    def __len__(self):
+        if self.return_object == 'NEO':
+            return len(self.selection)
+        count = sum(self.approach_count(neo) for neo in self.neos())
+        return count if self.number is None else min(count, self.number)
+
+    def __getitem__(self, item):
+        if self.return_object == 'NEO' and not isinstance(item, slice):
+            return self.store[self.selection[item]]
+        return list(self)[item]
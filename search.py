@@ -1,8 +1,12 @@
 from collections import namedtuple
 from enum import Enum
+import heapq
+from itertools import chain
 import operator
 from exceptions import UnsupportedFeature
-from models import NearEarthObject, OrbitPath
+from models import NearEarthObject, OrbitPath, date_to_day
+from results import NEOResultSet
+from views import NEOViews
 
 
 class DateSearch(Enum):
@@ -26,8 +30,9 @@ class Query(object):
     to structure the query information into a format the NEOSearcher can use for date search.
     """
 
-    Selectors = namedtuple('Selectors', ['date_search', 'number', 'filters', 'return_object'])
+    Selectors = namedtuple('Selectors', ['date_search', 'number', 'filters', 'return_object', 'order', 'lookup'])
     DateSearch = namedtuple('DateSearch', ['type', 'values'])
+    Lookup = namedtuple('Lookup', ['names', 'prefixes', 'ids'])
     ReturnObjects = {'NEO': NearEarthObject, 'Path': OrbitPath}
 
     def __init__(self, **kwargs):
@@ -36,10 +41,14 @@ class Query(object):
         """
         # TODO: What instance variables will be useful for storing on the Query object?
         self.number = None
+        self.date = None
         self.start_date = None
         self.end_date = None
         self.return_object = None
         self.filter = None
+        self.order = None
+        self.name = None
+        self.id = None
         for key, value in kwargs.items():
             if key == 'number':
                 self.number = value
@@ -53,6 +62,12 @@ class Query(object):
                 self.return_object = value
             elif key == 'filter':
                 self.filter = value
+            elif key == 'order':
+                self.order = value
+            elif key == 'name':
+                self.name = value
+            elif key == 'id':
+                self.id = value
 
 
     def build_query(self):
@@ -62,23 +77,67 @@ class Query(object):
 
         :return: QueryBuild.Selectors namedtuple that translates the dict of query options into a SearchOperation
         """
+        # Dates are searched as days since 1970-01-01, like the orbit dates of the database
         if self.end_date:
-            date_search = self.DateSearch('between', [self.start_date, self.end_date])
+            date_search = self.DateSearch('between', [date_to_day(self.start_date), date_to_day(self.end_date)])
+        elif self.date or not (self.name or self.id):
+            date_search = self.DateSearch('equals', [date_to_day(self.date)])
         else:
-            date_search = self.DateSearch('equals', [self.date])
+            date_search = None
+
+        # Names ending with '*' search by name prefix
+        if self.name or self.id:
+            lookup_names = self.as_list(self.name)
+            names = [name for name in lookup_names if not name.endswith('*')]
+            prefixes = [name[:-1] for name in lookup_names if name.endswith('*')]
+            lookup = self.Lookup(names, prefixes, self.parse_ids(self.as_list(self.id)))
+        else:
+            lookup = None
 
         # TODO: Translate the query parameters into a QueryBuild.Selectors object
         if self.filter:
             filter = Filter.create_filter_options(self.filter)
         else:
             filter = None
-        return self.Selectors(date_search, self.number, filter, self.return_object)
+        if self.order:
+            order = Order.create_order(self.order)
+        else:
+            order = None
+        return self.Selectors(date_search, self.number, filter, self.return_object, order, lookup)
+
+    @staticmethod
+    def as_list(values):
+        """
+        :param values: list of values, a single value or None
+        :return: list of the values
+        """
+        if values is None:
+            return []
+        if isinstance(values, (str, int)):
+            return [values]
+        return list(values)
+
+    @staticmethod
+    def parse_ids(ids):
+        """
+        :param ids: list of int or str representing Near Earth Object ids
+        :return: list of int ids
+        """
+        parsed_ids = []
+        for id_ in ids:
+            try:
+                parsed_ids.append(int(id_))
+            except (TypeError, ValueError):
+                raise UnsupportedFeature(f'Not a valid id: "{id_}"')
+        return parsed_ids
 
 
 class Filter(object):
     """
     Object representing optional filter options to be used in the date search for Near Earth Objects.
     Each filter is one of Filter.Operators provided with a field to filter on a value.
+
+    OrbitPath filters only consider the orbits on the searched dates.
     """
     Options = {
         # TODO: Create a dict of filter name to the NearEarthObject or OrbitalPath property
@@ -107,7 +166,20 @@ class Filter(object):
         self.field = field
         self.object = object
         self.operation = operation
-        self.value = value
+        self.value = self.parse_value(object, value)
+
+    @staticmethod
+    def parse_value(object, value):
+        """
+        Class function that converts the raw filter value into the type of the filtered property
+
+        :param object: str representing object to filter on
+        :param value: str representing value to filter for
+        :return: bool for is_hazardous, float for diameter and distance
+        """
+        if object == 'is_hazardous':
+            return str(value).lower() == 'true'
+        return float(value)
 
     @staticmethod
     def create_filter_options(filter_options):
@@ -140,35 +212,132 @@ class Filter(object):
         """
         Function that applies the filter operation onto a set of results
 
-        :param results: List of Near Earth Object results
-        :return: filtered list of Near Earth Object results
+        :param results: NEOResultSet of Near Earth Object results
+        :return: NEOResultSet narrowed to the Near Earth Objects passing the filter
         """
         # TODO: Takes a list of NearEarthObjects and applies the value of its filter operation to the results
-        valid_neos = []
-        for neo_object in results:
-            func = self.Operators[self.operation]
-            if self.field == 'NearEarthObject':
-                if self.object == 'diameter':
-                    if self.is_valid_neo(func, neo_object.diameter_min_km, self.value):
-                        valid_neos.append(neo_object)
-                elif self.object == 'is_hazardous':
-                    if self.is_valid_neo(func, neo_object.is_potentially_hazardous_asteroid, self.value):
-                        valid_neos.append(neo_object)
-            else : #OrbitPath
-                if self.object == 'distance':
-                    for orbit_path in neo_object.orbits:
-                        if self.is_valid_neo(func, orbit_path.miss_distance_kilometers, self.value):
-                            valid_neos.append(neo_object)
-                            break
-        return valid_neos
+        start_date = results.start_date
+        end_date = results.end_date
+        return results.narrow(lambda neo_object: self.matches(neo_object, start_date, end_date))
+
+    def matches(self, neo_object, start_date=None, end_date=None):
+        """
+        :param neo_object: NearEarthObject
+        :param start_date: int representing the first searched date in days since 1970-01-01, None for every date
+        :param end_date: int representing the last searched date in days since 1970-01-01, None for every date
+        :return: bool representing if the Near Earth Object passes the filter
+        """
+        func = self.Operators[self.operation]
+        if self.field == 'NearEarthObject':
+            if self.object == 'diameter':
+                return self.is_valid_neo(func, neo_object.diameter_min_km, self.value)
+            elif self.object == 'is_hazardous':
+                return self.is_valid_neo(func, neo_object.is_potentially_hazardous_asteroid, self.value)
+        else : #OrbitPath
+            if self.object == 'distance':
+                # Some approach is below (above) the value if the closest (farthest) one is
+                if self.operation in ('<', '<='):
+                    distance = neo_object.min_distance(start_date, end_date)
+                    return distance is not None and self.is_valid_neo(func, distance, self.value)
+                elif self.operation in ('>', '>='):
+                    distance = neo_object.max_distance(start_date, end_date)
+                    return distance is not None and self.is_valid_neo(func, distance, self.value)
+                for distance in neo_object.approach_distances_between(start_date, end_date):
+                    if self.is_valid_neo(func, distance, self.value):
+                        return True
+        return False
 
     def is_valid_neo(self, func, actual_val, threshold):
-        if func(str(actual_val), str(threshold)):
+        if func(actual_val, threshold):
             return True
         else:
             return False
 
 
+class Order(object):
+    """
+    Object representing an optional ordering of the search results. The results are ranked on a field of the
+    NearEarthObject or OrbitPath, ascending unless the option is suffixed with ':desc', and only the requested
+    number of results is selected with a bounded heap instead of sorting every result.
+    """
+    Options = {
+        'distance': 'miss_distance_kilometers',
+        'diameter': 'diameter_min_km',
+        'date': 'close_approach_date'
+    }
+
+    Directions = ['asc', 'desc']
+
+    def __init__(self, field, descending=False):
+        """
+        :param field: str representing the Order.Options field to order on
+        :param descending: bool representing if the largest values come first
+        """
+        self.field = field
+        self.descending = descending
+
+    @staticmethod
+    def create_order(order_option):
+        """
+        Class function that transforms the order option raw input into an Order
+
+        :param order_option: str in format "order_option" or "order_option:direction" e.g. diameter:desc
+        :return: Order
+        """
+        field, _, direction = order_option.partition(':')
+        if field not in Order.Options or (direction and direction not in Order.Directions):
+            raise UnsupportedFeature(f'Not a valid order option: "{order_option}"')
+        return Order(field, direction == 'desc')
+
+    def key(self, return_object, db, start_date=None, end_date=None):
+        """
+        Function that builds the sort key for the results of a given return object. NearEarthObjects are ranked on
+        their approaches between start_date and end_date only.
+
+        :param return_object: str representing the returned entity, 'NEO', any other value returning OrbitPaths
+        :param db: NEOSnapshot used to find the NearEarthObject of an OrbitPath
+        :param start_date: int representing the first searched date in days since 1970-01-01, None for every date
+        :param end_date: int representing the last searched date in days since 1970-01-01, None for every date
+        :return: function mapping a result to its sort value
+        """
+        if return_object == 'NEO':
+            if self.field == 'diameter':
+                return operator.attrgetter(self.Options[self.field])
+            if self.field == 'distance':
+                return lambda neo: neo.min_distance(start_date, end_date)
+            return lambda neo: neo.approach_dates[neo.approach_bounds(start_date, end_date)[0]]
+
+        if self.field == 'diameter':
+            return lambda orbit: db.get_neo_object(orbit.neo_name).diameter_min_km
+        return operator.attrgetter(self.Options[self.field])
+
+    def apply(self, results, number, key):
+        """
+        Function that orders a set of results, keeping only the first number of them
+
+        The unique results are streamed through a heap of at most number entries, so only the kept results are
+        held in memory.
+
+        :param results: NEOResultSet of NearEarthObject or OrbitPath results
+        :param number: int representing max number of results to return, None to return all of them
+        :param key: function mapping a result to its sort value
+        :return: ordered list of at most number results
+        """
+        if number is None:
+            return sorted(results, key=key, reverse=self.descending)
+        if number <= 0:
+            return []
+
+        # Max heap of the kept results, its top being the last one in order, the latest among equal sort values
+        heap = []
+        for counter, result in enumerate(results.stream()):
+            value = -key(result) if self.descending else key(result)
+            if len(heap) < number:
+                heapq.heappush(heap, (-value, -counter, result))
+            elif value < -heap[0][0]:
+                heapq.heapreplace(heap, (-value, -counter, result))
+        return [entry[2] for entry in sorted(heap, reverse=True)]
+
 
 class NEOSearcher(object):
     """
@@ -195,7 +364,7 @@ class NEOSearcher(object):
         specified.
 
         :param query: Query.Selectors object with query information
-        :return: Dataset of NearEarthObjects or OrbitalPaths
+        :return: NEOResultSet of NearEarthObjects or OrbitalPaths, or list of them when an order is requested
         """
         # TODO: This is a generic method that will need to understand, using DateSearch, how to implement search
         # TODO: Write instance methods that get_objects can use to implement the two types of DateSearch your project
@@ -205,45 +374,117 @@ class NEOSearcher(object):
         number = query[1]
         filter = query[2]
         return_object = query[3]
-        if date_search[0] == self.date_search_equals:
-            res = self.date_equals(self.db, date_search[1][0], filter, return_object)
+        order = query[4]
+        lookup = query[5]
+        # Every index is read from the same snapshot, even if the database reloads during the search
+        db = self.db.snapshot
+        if lookup:
+            res = self.name_lookup(db, lookup, date_search, filter, return_object)
+        elif date_search[0] == self.date_search_equals:
+            res = self.date_equals(db, date_search[1][0], filter, return_object)
         else:
-            res = self.date_between(self.db, date_search[1][0], date_search[1][1], filter, return_object)
+            res = self.date_between(db, date_search[1][0], date_search[1][1], filter, return_object)
 
-        return res[:number]
+        if order:
+            return order.apply(res, number, order.key(return_object, db, res.start_date, res.end_date))
+        return res.limit(number)
 
 
     def date_equals(self, db, date, filters, return_object):
-        total_neos = db.orbitdate_neo_mapping[date]
-        if filters:
-            for filter in filters['NearEarthObject']:
-                total_neos = filter.apply(total_neos)
-            for filter in filters['OrbitPath']:
-                total_neos = filter.apply(total_neos)
+        res = self.view_search(db, date, date, filters, return_object)
+        if res is not None:
+            return res
+        candidates = chain.from_iterable(
+            partition.orbitdate_neo_mapping.get(date, ()) for partition in db.get_partitions(date, date)
+        )
+        return self.filter_neos(NEOResultSet(db.neos, candidates, return_object, date, date), filters)
 
-        if return_object == 'NEO':
-            return total_neos
+    def date_between(self, db, start_date, end_date, filters, return_object):
+        res = self.view_search(db, start_date, end_date, filters, return_object)
+        if res is not None:
+            return res
+        candidates = chain.from_iterable(
+            partition.orbitdate_neo_mapping[each]
+            for partition in db.get_partitions(start_date, end_date)
+            for each in partition.orbitdate_neo_mapping
+            if each >=start_date and each <= end_date
+        )
+        return self.filter_neos(NEOResultSet(db.neos, candidates, return_object, start_date, end_date), filters)
+
+    def view_search(self, db, start_date, end_date, filters, return_object):
+        """
+        Answers the standard README queries with the database NEOViews: a hazardous filter, with an optional
+        diameter filter, selects a slice of the hazardous Near Earth Objects sorted by diameter of every searched
+        date, otherwise a distance filter selects a slice of the Near Earth Objects sorted by miss distance. The
+        other filters are then applied to the selected Near Earth Objects.
+
+        :param db: NEOSnapshot holding the NearEarthObject instances and their OrbitPath instances
+        :param start_date: int representing the first searched date in days since 1970-01-01
+        :param end_date: int representing the last searched date in days since 1970-01-01
+        :param filters: dict of Filters with key of NearEarthObject or OrbitPath
+        :param return_object: str representing the returned entity, 'NEO' or 'Path'
+        :return: NEOResultSet of NearEarthObjects or OrbitalPaths, None if no view answers the query
+        """
+        if db.views is None or not filters:
+            return None
+
+        hazardous = next((filter for filter in filters['NearEarthObject']
+                          if filter.object == 'is_hazardous' and filter.operation == '=' and filter.value is True), None)
+        if hazardous:
+            view = db.views.hazardous_by_diameter
+            key_filter = next((filter for filter in filters['NearEarthObject']
+                               if filter.object == 'diameter' and filter.operation in NEOViews.Bounds), None)
+            view_filters = [hazardous, key_filter]
+        else:
+            view = db.views.orbits_by_distance
+            key_filter = next((filter for filter in filters['OrbitPath']
+                               if filter.object == 'distance' and filter.operation in NEOViews.Bounds), None)
+            view_filters = [key_filter]
+            if key_filter is None:
+                return None
+
+        candidates = chain.from_iterable(
+            NEOViews.select(view, date, key_filter) for date in range(start_date, end_date + 1)
+        )
+        res = NEOResultSet(db.neos, candidates, return_object, start_date, end_date)
+        return self.filter_neos(res, {
+            'NearEarthObject': [filter for filter in filters['NearEarthObject'] if filter not in view_filters],
+            'OrbitPath': [filter for filter in filters['OrbitPath'] if filter not in view_filters]
+        })
+
+    def name_lookup(self, db, lookup, date_search, filters, return_object):
+        """
+        Finds the Near Earth Objects by name, name prefix or id with the database name index, keeping only the ones
+        with an orbit on the searched dates if a date search is provided.
+
+        :param db: NEOSnapshot holding the NearEarthObject instances and their OrbitPath instances
+        :param lookup: Query.Lookup namedtuple of names, name prefixes and ids to find
+        :param date_search: Query.DateSearch namedtuple or None to search every date
+        :param filters: dict of Filters with key of NearEarthObject or OrbitPath
+        :param return_object: str representing the returned entity, 'NEO' or 'Path'
+        :return: NEOResultSet of NearEarthObjects or OrbitalPaths
+        """
+        positions = db.name_index.positions(lookup.names, lookup.prefixes, lookup.ids)
+        if date_search:
+            start_date = date_search[1][0]
+            end_date = date_search[1][-1]
+            res = NEOResultSet(db.neos, positions, return_object, start_date, end_date)
+            res.narrow(lambda neo: neo.has_approach(start_date, end_date))
         else:
-            orbits = []
-            for neo in total_neos:
-                orbits.extend(neo.orbits)
-            return orbits
+            res = NEOResultSet(db.neos, positions, return_object)
+        return self.filter_neos(res, filters)
 
-    def date_between(self, db, start_date, end_date, filters, return_object):
-        res = []
-        for each in db.orbitdate_neo_mapping:
-            if each >=start_date and each <= end_date:
-                res.extend(db.orbitdate_neo_mapping[each])
+    def filter_neos(self, results, filters):
+        """
+        Applies the NearEarthObject filters then the OrbitPath filters to the Near Earth Objects found by a search
+
+        :param results: NEOResultSet of the Near Earth Objects found by a search
+        :param filters: dict of Filters with key of NearEarthObject or OrbitPath
+        :return: NEOResultSet of NearEarthObjects or OrbitalPaths
+        """
         if filters:
             for filter in filters['NearEarthObject']:
-                res = filter.apply(res)
+                results = filter.apply(results)
             for filter in filters['OrbitPath']:
-                res = filter.apply(res)
-
-        if return_object == 'NEO':
-            return res
-        else:
-            orbits = []
-            for neo in res:
-                orbits.extend(neo.orbits)
-            return orbits
+                results = filter.apply(results)
+        return results
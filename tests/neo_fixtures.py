@@ -0,0 +1,75 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from database import NEODatabase
+from search import Query, NEOSearcher
+
+
+COLUMNS = ['id', 'name', 'nasa_jpl_url', 'absolute_magnitude_h', 'estimated_diameter_min_kilometers',
+           'is_potentially_hazardous_asteroid', 'close_approach_date', 'miss_distance_kilometers']
+
+
+def write_neo_csv(filename, approaches):
+    """
+    Writes a small Near Earth Object csv file with one row per close approach.
+
+    :param filename: str representing the pathway of the csv file to write
+    :param approaches: list of (id, name, diameter_min_km, is_hazardous, close_approach_date, miss_distance_km)
+    :return: None
+    """
+    with open(filename, 'w', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(COLUMNS)
+        for id_, name, diameter, is_hazardous, date, distance in approaches:
+            writer.writerow([id_, name, f'http://ssd.jpl.nasa.gov/sbdb.cgi?sstr={id_}', 20.0,
+                             diameter, is_hazardous, date, distance])
+
+
+APPROACHES = [
+    (2000001, '(2019 AA)', 0.10, True, '2020-01-01', 500000.0),
+    (2000002, '(2019 AB)', 0.02, False, '2020-01-01', 90000.0),
+    (2000003, '(2020 AC)', 0.30, True, '2020-01-02', 1200000.0),
+    (2000001, '(2019 AA)', 0.10, True, '2020-01-03', 40000.0),
+    (2000004, '(2020 AD)', 0.05, False, '2020-01-03', 700000.0),
+    (2000005, '433 Eros (A898 PA)', 16.8, False, '2020-01-05', 30000000.0),
+    (2000003, '(2020 AC)', 0.30, True, '2020-02-01', 2000000.0),
+]
+
+
+class NEODatabaseTestCase(unittest.TestCase):
+    """
+    Base Test Class writing the neo_data_files of the test class into a temporary directory loaded into self.db.
+    Searches are built from the query_defaults of the test class, overridden by the search arguments.
+    """
+    neo_data_files = {'neo_data.csv': APPROACHES}
+    query_defaults = {}
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        for name, approaches in self.neo_data_files.items():
+            write_neo_csv(os.path.join(self.tmp_dir.name, name), approaches)
+        self.neo_data_file = os.path.join(self.tmp_dir.name, next(iter(self.neo_data_files)))
+
+        self.db = self.load_database()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def load_database(self, **kwargs):
+        """
+        :param kwargs: additional NEODatabase arguments
+        :return: NEODatabase loaded from every csv file of the temporary directory
+        """
+        db = NEODatabase(filename=self.tmp_dir.name, **kwargs)
+        db.load_data()
+        return db
+
+    def search(self, db=None, **kwargs):
+        query_selectors = Query(**{**self.query_defaults, **kwargs}).build_query()
+        return NEOSearcher(db or self.db).get_objects(query_selectors)
+
+    @staticmethod
+    def names(results):
+        return [neo.name for neo in results]
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from database import NEODatabase
+from search import Query, NEOSearcher
+from tests.neo_fixtures import write_neo_csv
+from writer import NEOWriter
+
+
+def create_approaches(prefix, count):
+    return [
+        (3000000 + number, f'({prefix} {number})', 0.01 * number, number % 2 == 0,
+         f'2020-01-{number % 10 + 1:02d}', 1000.0 * number)
+        for number in range(count)
+    ]
+
+
+class TestNEOConcurrentSearches(unittest.TestCase):
+    """
+    Test Class with test cases for searching a NEODatabase from several threads while it reloads.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.neo_data_files = {}
+        for prefix, count in [('A', 40), ('B', 70)]:
+            self.neo_data_files[prefix] = os.path.join(self.tmp_dir.name, f'neo_{prefix}.csv')
+            write_neo_csv(self.neo_data_files[prefix], create_approaches(prefix, count))
+
+        self.db = NEODatabase(filename=self.neo_data_files['A'])
+        self.db.load_data()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_searches_see_one_snapshot_during_reloads(self):
+        expected = {'A': (20, 40), 'B': (35, 70)}
+        queries = [
+            (Query(start_date='2020-01-01', end_date='2020-01-10', return_object='NEO').build_query(), 1),
+            (Query(start_date='2020-01-01', end_date='2020-01-10', return_object='NEO',
+                   filter=['is_hazardous:=:True']).build_query(), 0),
+        ]
+        errors = []
+        searches = []
+        done = threading.Event()
+
+        def search():
+            try:
+                while not done.is_set():
+                    for query_selectors, expected_position in queries:
+                        names = [neo.name for neo in NEOSearcher(self.db).get_objects(query_selectors)]
+                        prefixes = {name[1] for name in names}
+                        self.assertEqual(len(prefixes), 1)
+                        self.assertEqual(len(names), expected[prefixes.pop()][expected_position])
+                        searches.append(1)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=search) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        try:
+            for reload in range(10):
+                self.db.load_data(self.neo_data_files['B' if reload % 2 == 0 else 'A'])
+        finally:
+            done.set()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertGreater(len(searches), 0)
+
+    def test_writer_keeps_no_state_between_writes(self):
+        writer = NEOWriter()
+        results = NEOSearcher(self.db).get_objects(Query(number=1, date='2020-01-01', return_object='NEO').build_query())
+        output_filename = os.path.join(self.tmp_dir.name, 'output.csv')
+        self.assertTrue(writer.write('csv_file', results, output_filename=output_filename))
+        self.assertFalse(hasattr(writer, 'filename'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import pathlib
 import unittest
 
 from database import NEODatabase
+from models import date_to_day
 from search import Query, NEOSearcher
 
 
@@ -153,10 +154,10 @@ class TestNEOSearchUseCases(unittest.TestCase):
             lambda neo: neo.diameter_min_km > 0.042 and neo.is_potentially_hazardous_asteroid, results)
         )
 
-        # Filter to NEO Orbit Paths with Matching Distance
+        # Filter to NEO Orbit Paths with Matching Distance between the searched dates
         all_orbits = []
         for neo in neo_ids:
-            all_orbits += neo.orbits
+            all_orbits += neo.approaches(date_to_day(self.start_date), date_to_day(self.end_date))
         unique_orbits = set()
         filtered_orbits = []
         for orbit in all_orbits:
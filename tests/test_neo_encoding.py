@@ -0,0 +1,47 @@
+import csv
+import os
+import unittest
+
+from models import date_to_day, day_to_date
+from tests.neo_fixtures import APPROACHES, NEODatabaseTestCase, write_neo_csv
+from writer import NEOWriter
+
+
+class TestNEOEncoding(NEODatabaseTestCase):
+    """
+    Test Class with test cases for the integer encoded orbit dates and the interned strings of the database.
+    """
+    def test_date_encoding_round_trip(self):
+        self.assertEqual(date_to_day('1970-01-01'), 0)
+        self.assertEqual(date_to_day('2020-01-01'), 18262)
+        self.assertEqual(day_to_date(18262), '2020-01-01')
+        self.assertEqual(day_to_date(date_to_day('1900-02-28')), '1900-02-28')
+
+    def test_orbit_dates_are_days(self):
+        self.assertEqual(sorted(self.db.orbitdate_neo_mapping)[0], 18262)
+        neo = self.db.get_neo_object('(2019 AA)')
+        self.assertEqual(sorted(orbit.close_approach_date for orbit in neo.orbits), [18262, 18264])
+
+    def test_orbit_names_are_interned(self):
+        neo = self.db.get_neo_object('(2020 AC)')
+        for orbit in neo.orbits:
+            self.assertIs(orbit.neo_name, neo.name)
+
+    def test_rows_without_name_are_skipped(self):
+        write_neo_csv(self.neo_data_file, APPROACHES + [(2000006, '', 0.5, True, '2020-01-04', 900000.0)])
+        self.db.load_data()
+        self.assertEqual(len(self.db.neos), 5)
+        self.assertNotIn(2000006, [neo.id for neo in self.db.neos])
+
+    def test_csv_output_decodes_dates(self):
+        results = self.search(number=2, date='2020-01-03', return_object='Path', order='date')
+        output_filename = os.path.join(self.tmp_dir.name, 'output.csv')
+        NEOWriter().write('csv_file', results, output_filename=output_filename)
+
+        with open(output_filename) as csv_file:
+            rows = list(csv.DictReader(csv_file))
+        self.assertEqual([row['close_approach_date'] for row in rows], ['2020-01-03', '2020-01-03'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from exceptions import UnsupportedFeature
+from search import Query
+from tests.neo_fixtures import NEODatabaseTestCase
+
+
+class TestNEONameLookup(NEODatabaseTestCase):
+    """
+    Test Class with test cases for finding Near Earth Objects by name, name prefix and id.
+    """
+    query_defaults = {'return_object': 'NEO'}
+
+    def test_index_exact_name_and_id(self):
+        self.assertEqual(self.db.name_index.get_by_name('433 Eros (A898 PA)').id, 2000005)
+        self.assertEqual(self.db.name_index.get_by_id('2000002').name, '(2019 AB)')
+        self.assertIsNone(self.db.name_index.get_by_name('(2019 ZZ)'))
+        self.assertIsNone(self.db.name_index.get_by_id(1))
+
+    def test_index_prefix(self):
+        self.assertEqual([neo.name for neo in self.db.name_index.search_prefix('(2019 ')], ['(2019 AA)', '(2019 AB)'])
+        self.assertEqual(self.db.name_index.search_prefix('(2021'), [])
+
+    def test_batched_lookup_is_unique(self):
+        results = self.search(name=['(2020*', '(2020 AC)'], id=[2000005, 2000003])
+        self.assertEqual([neo.name for neo in results], ['(2020 AC)', '(2020 AD)', '433 Eros (A898 PA)'])
+
+    def test_lookup_single_name_and_id(self):
+        self.assertEqual(self.names(self.search(name='(2020 AC)')), ['(2020 AC)'])
+        self.assertEqual(self.names(self.search(name='(2019*')), ['(2019 AA)', '(2019 AB)'])
+        self.assertEqual(self.names(self.search(id='2000005')), ['433 Eros (A898 PA)'])
+
+    def test_invalid_id(self):
+        with self.assertRaises(UnsupportedFeature):
+            Query(id=['abc']).build_query()
+
+    def test_lookup_with_date_and_filters(self):
+        results = self.search(name=['(20*'], date='2020-01-03')
+        self.assertEqual([neo.name for neo in results], ['(2019 AA)', '(2020 AD)'])
+
+        results = self.search(name=['(20*'], start_date='2020-01-01', end_date='2020-01-10',
+                              filter=['is_hazardous:=:True'])
+        self.assertEqual([neo.name for neo in results], ['(2019 AA)', '(2020 AC)'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from models import NearEarthObject, OrbitPath, date_to_day
+from search import Filter
+
+
+class TestNEOOrbitHistory(unittest.TestCase):
+    """
+    Test Class with test cases for the orbit history arrays of a NearEarthObject.
+    """
+
+    def setUp(self):
+        self.neo = NearEarthObject(id=2000001, name='(2019 AA)', diameter_min_km=0.1,
+                                   is_potentially_hazardous_asteroid=True)
+        self.neo.extend_orbits([
+            self.orbit('2020-03-01', 700.0),
+            self.orbit('2020-01-01', 500.0),
+        ])
+        self.neo.update_orbits(self.orbit('2020-02-01', 900.0))
+
+    def orbit(self, date, distance):
+        return OrbitPath(name='(2019 AA)', close_approach_date=date_to_day(date), miss_distance_kilometers=distance)
+
+    def test_orbits_are_sorted_by_date(self):
+        self.assertEqual(list(self.neo.approach_dates), [date_to_day(date) for date in
+                                                         ['2020-01-01', '2020-02-01', '2020-03-01']])
+        self.assertEqual(list(self.neo.approach_distances), [500.0, 900.0, 700.0])
+        self.assertEqual([orbit.miss_distance_kilometers for orbit in self.neo.orbits], [500.0, 900.0, 700.0])
+        self.assertEqual(self.neo.min_miss_distance, 500.0)
+        self.assertEqual(self.neo.max_miss_distance, 900.0)
+
+    def test_update_orbits_tracks_miss_distances(self):
+        self.neo.update_orbits(self.orbit('2020-04-01', 100.0))
+        self.neo.update_orbits(self.orbit('2019-12-01', 1000.0))
+        self.assertEqual(self.neo.min_miss_distance, 100.0)
+        self.assertEqual(self.neo.max_miss_distance, 1000.0)
+        self.assertEqual(list(self.neo.approach_distances), [1000.0, 500.0, 900.0, 700.0, 100.0])
+
+    def test_windowed_approaches(self):
+        start_date = date_to_day('2020-01-15')
+        end_date = date_to_day('2020-03-01')
+        self.assertEqual([orbit.miss_distance_kilometers for orbit in self.neo.approaches(start_date, end_date)],
+                         [900.0, 700.0])
+        self.assertEqual(self.neo.min_distance(start_date, end_date), 700.0)
+        self.assertEqual(self.neo.max_distance(start_date), 900.0)
+        self.assertTrue(self.neo.has_approach(end_date, end_date))
+        self.assertFalse(self.neo.has_approach(date_to_day('2020-04-01')))
+        self.assertIsNone(self.neo.min_distance(date_to_day('2020-01-02'), date_to_day('2020-01-31')))
+
+    def test_distance_filter_uses_window(self):
+        start_date = date_to_day('2020-02-01')
+        end_date = date_to_day('2020-03-01')
+        self.assertTrue(Filter('OrbitPath', 'distance', '<', '600').matches(self.neo))
+        self.assertFalse(Filter('OrbitPath', 'distance', '<', '600').matches(self.neo, start_date, end_date))
+        self.assertTrue(Filter('OrbitPath', 'distance', '>=', '900').matches(self.neo, start_date, end_date))
+        self.assertTrue(Filter('OrbitPath', 'distance', '=', '700').matches(self.neo, start_date, end_date))
+        self.assertFalse(Filter('OrbitPath', 'distance', '=', '500').matches(self.neo, start_date, end_date))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+from exceptions import UnsupportedFeature
+from search import Query
+from tests.neo_fixtures import APPROACHES, NEODatabaseTestCase, write_neo_csv
+
+
+class TestNEOSearchOrder(NEODatabaseTestCase):
+    """
+    Test Class with test cases for ordering search results with the Query order option.
+    """
+    query_defaults = {'start_date': '2020-01-01', 'end_date': '2020-01-10'}
+
+    def test_closest_neos_between_dates(self):
+        results = self.search(number=2, return_object='NEO', order='distance')
+        self.assertEqual([neo.name for neo in results], ['(2019 AA)', '(2019 AB)'])
+
+    def test_largest_hazardous_neos_between_dates(self):
+        results = self.search(number=5, return_object='NEO', order='diameter:desc', filter=['is_hazardous:=:True'])
+        self.assertEqual([neo.name for neo in results], ['(2020 AC)', '(2019 AA)'])
+
+    def test_closest_paths_between_dates(self):
+        results = self.search(number=3, return_object='Path', order='distance')
+        distances = [orbit.miss_distance_kilometers for orbit in results]
+        self.assertEqual(distances, [40000.0, 90000.0, 500000.0])
+
+    def test_order_only_ranks_approaches_between_dates(self):
+        write_neo_csv(self.neo_data_file, APPROACHES + [
+            (2000006, '(2018 AE)', 0.5, True, '2019-06-01', 10.0),
+            (2000006, '(2018 AE)', 0.5, True, '2020-01-04', 900000.0),
+        ])
+        self.db.load_data()
+
+        results = self.search(number=1, return_object='Path', order='distance')
+        self.assertEqual([orbit.miss_distance_kilometers for orbit in results], [40000.0])
+
+        results = self.search(return_object='Path', order='distance:desc', filter=['is_hazardous:=:True'])
+        self.assertEqual([orbit.miss_distance_kilometers for orbit in results], [1200000.0, 900000.0, 500000.0, 40000.0])
+
+        results = self.search(number=6, return_object='NEO', order='distance:desc')
+        self.assertEqual([neo.name for neo in results][:2], ['433 Eros (A898 PA)', '(2020 AC)'])
+
+        results = self.search(number=1, return_object='NEO', order='date:desc')
+        self.assertEqual([neo.name for neo in results], ['433 Eros (A898 PA)'])
+
+    def test_order_without_number_returns_every_unique_result(self):
+        results = self.search(return_object='NEO', order='date')
+        self.assertEqual(len(results), 5)
+        self.assertEqual(results[-1].name, '433 Eros (A898 PA)')
+
+    def test_order_paths_without_return_object(self):
+        results = self.search(number=2, order='distance')
+        self.assertEqual([orbit.miss_distance_kilometers for orbit in results], [40000.0, 90000.0])
+
+        results = self.search(name=['(2019 AA)', '(2020 AC)'], order='diameter:desc')
+        self.assertEqual([orbit.neo_name for orbit in results], ['(2020 AC)', '(2019 AA)', '(2019 AA)'])
+
+    def test_unsupported_order(self):
+        with self.assertRaises(UnsupportedFeature):
+            Query(date='2020-01-01', order='distance:sideways').build_query()
+
+
+if __name__ == '__main__':
+    unittest.main()
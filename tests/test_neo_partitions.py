@@ -0,0 +1,60 @@
+import asyncio
+import os
+import unittest
+
+from database import NEODatabase
+from models import date_to_day
+from tests.neo_fixtures import APPROACHES, NEODatabaseTestCase
+
+
+class TestNEODatabasePartitions(NEODatabaseTestCase):
+    """
+    Test Class with test cases for loading a directory of csv files into one partitioned NEODatabase.
+    """
+    neo_data_files = {'neo_2020_01.csv': APPROACHES[:-1], 'neo_2020_02.csv': APPROACHES[-1:]}
+
+    def test_one_partition_per_file(self):
+        self.assertEqual(len(self.db.partitions), 2)
+        self.assertEqual(self.db.partitions[0].start_date, date_to_day('2020-01-01'))
+        self.assertEqual(self.db.partitions[0].end_date, date_to_day('2020-01-05'))
+        self.assertEqual(self.db.partitions[1].start_date, date_to_day('2020-02-01'))
+
+    def test_neo_in_several_files_is_single_instance(self):
+        neo = self.db.get_neo_object('(2020 AC)')
+        self.assertEqual(len(neo.orbits), 2)
+        position = self.db.orbitdate_neo_mapping[date_to_day('2020-02-01')][0]
+        self.assertIs(self.db.neos[position], neo)
+        self.assertIs(self.db.partitions[1].neoname_neo_mapping['(2020 AC)'], neo)
+
+    def test_searches_are_routed_to_overlapping_partitions(self):
+        partitions = self.db.get_partitions(date_to_day('2020-01-20'), date_to_day('2020-02-10'))
+        self.assertEqual([os.path.basename(partition.filename) for partition in partitions], ['neo_2020_02.csv'])
+
+        results = self.search(number=10, start_date='2020-01-20', end_date='2020-02-10', return_object='NEO')
+        self.assertEqual([neo.name for neo in results], ['(2020 AC)'])
+
+    def test_glob_pattern(self):
+        db = NEODatabase(filename=os.path.join(self.tmp_dir.name, 'neo_*_02.csv'))
+        db.load_data()
+        self.assertEqual(list(db.neoname_neo_mapping), ['(2020 AC)'])
+
+    def test_load_from_running_event_loop(self):
+        async def load():
+            db = NEODatabase(filename=self.tmp_dir.name)
+            db.load_data()
+            other_db = NEODatabase(filename=self.tmp_dir.name)
+            await other_db.load_data_async()
+            return db, other_db
+
+        for db in asyncio.run(load()):
+            self.assertEqual(len(db.partitions), 2)
+            self.assertEqual(len(db.get_neo_object('(2020 AC)').orbits), 2)
+
+    def test_no_matching_files(self):
+        db = NEODatabase(filename=os.path.join(self.tmp_dir.name, 'missing_*.csv'))
+        with self.assertRaises(FileNotFoundError):
+            db.load_data()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+from datetime import date, timedelta
+import os
+import unittest
+from unittest import mock
+
+import models
+from results import NEOResultSet
+from search import Order
+from tests.neo_fixtures import NEODatabaseTestCase, write_neo_csv
+from writer import NEOWriter
+
+
+class TestNEOResultSet(NEODatabaseTestCase):
+    """
+    Test Class with test cases for the NEOResultSet selections returned by searches.
+    """
+    query_defaults = {'start_date': '2020-01-01', 'end_date': '2020-01-10'}
+
+    def test_selection_is_unique_positions_into_store(self):
+        results = self.search(number=10, return_object='NEO')
+        self.assertIsInstance(results, NEOResultSet)
+        self.assertIs(results.store, self.db.neos)
+        self.assertEqual(len(results), 5)
+        self.assertEqual(len(set(results.selection)), 5)
+
+    def test_selection_stops_at_number(self):
+        results = self.search(number=2, return_object='NEO', filter=['diameter:>=:0.05'])
+        self.assertEqual(len(results.selection), 2)
+        self.assertTrue(all(neo.diameter_min_km >= 0.05 for neo in results))
+
+    def test_filters_compare_numbers(self):
+        results = self.search(return_object='NEO', filter=['diameter:>:9', 'distance:>=:1000000'])
+        self.assertEqual([neo.name for neo in results], ['433 Eros (A898 PA)'])
+
+    def test_path_results_are_limited_to_number_of_orbits(self):
+        results = self.search(number=3, return_object='Path', filter=['is_hazardous:=:True'])
+        orbits = list(results)
+        self.assertEqual(len(orbits), 3)
+        self.assertEqual(len(results), 3)
+        self.assertEqual({orbit.neo_name for orbit in orbits}, {'(2019 AA)', '(2020 AC)'})
+
+    def test_narrow_does_not_change_database_index(self):
+        date_positions = list(self.db.orbitdate_neo_mapping[min(self.db.orbitdate_neo_mapping)])
+        results = NEOResultSet(self.db.neos, iter(date_positions)).narrow(lambda neo: neo.diameter_min_km > 1)
+        self.assertEqual(len(results), 0)
+        self.assertEqual(list(self.db.orbitdate_neo_mapping[min(self.db.orbitdate_neo_mapping)]), date_positions)
+
+    def test_ordered_top_results_are_streamed(self):
+        candidates = [position for date_positions in self.db.orbitdate_neo_mapping.values()
+                      for position in date_positions] * 3
+        results = NEOResultSet(self.db.neos, iter(candidates))
+        order = Order.create_order('diameter:desc')
+        top = order.apply(results, 3, order.key('NEO', self.db.snapshot))
+        self.assertEqual([neo.name for neo in top], ['433 Eros (A898 PA)', '(2020 AC)', '(2019 AA)'])
+        self.assertIsNone(results._selection)
+
+    def test_ordered_path_results_build_each_orbit_once(self):
+        approach_dates = [date(2000, 1, 1) + timedelta(days=30 * number) for number in range(400)]
+        write_neo_csv(self.neo_data_file, [
+            (2000001, '(2019 AA)', 0.10, True, approach_date.isoformat(), 1000.0 + number)
+            for number, approach_date in enumerate(approach_dates)
+        ])
+        self.db = self.load_database()
+        with mock.patch.object(models, 'OrbitPath', wraps=models.OrbitPath) as orbit_path:
+            orbits = self.search(number=10, start_date='2000-01-01', end_date='2040-01-01', return_object='Path',
+                                 order='distance')
+        self.assertEqual([orbit.miss_distance_kilometers for orbit in orbits],
+                         [1000.0 + number for number in range(10)])
+        self.assertEqual(orbit_path.call_count, 400)
+
+    def test_write_empty_results(self):
+        output_filename = os.path.join(self.tmp_dir.name, 'output.csv')
+        for return_object in ['NEO', 'Path']:
+            results = self.search(return_object=return_object, filter=['diameter:>:100'])
+            self.assertTrue(NEOWriter().write('csv_file', results, output_filename=output_filename))
+            with open(output_filename) as csv_file:
+                self.assertEqual(len(csv_file.readlines()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from models import date_to_day
+from tests.neo_fixtures import APPROACHES, NEODatabaseTestCase, write_neo_csv
+
+
+class TestNEOViews(NEODatabaseTestCase):
+    """
+    Test Class with test cases for the materialized views answering the README#Requirements queries.
+    """
+    query_defaults = {'return_object': 'NEO'}
+
+    def setUp(self):
+        super().setUp()
+        self.db_without_views = self.load_database(materialized_views=False)
+
+    def test_views_are_sorted(self):
+        keys, positions = self.db.views.orbits_by_distance[date_to_day('2020-01-01')]
+        self.assertEqual(list(keys), [90000.0, 500000.0])
+        self.assertEqual([self.db.neos[position].name for position in positions], ['(2019 AB)', '(2019 AA)'])
+
+        keys, positions = self.db.views.hazardous_by_diameter[date_to_day('2020-01-01')]
+        self.assertEqual([self.db.neos[position].name for position in positions], ['(2019 AA)'])
+
+    def test_views_match_filters(self):
+        filters = [
+            ['is_hazardous:=:True'],
+            ['diameter:>:0.05', 'is_hazardous:=:True'],
+            ['diameter:>:0.05', 'is_hazardous:=:True', 'distance:<:600000'],
+            ['distance:>=:500000'],
+            ['diameter:<=:0.1', 'distance:<:100000'],
+        ]
+        for filter in filters:
+            for dates in [dict(date='2020-01-01'), dict(start_date='2020-01-01', end_date='2020-01-10')]:
+                with self.subTest(filter=filter, **dates):
+                    self.assertEqual(sorted(self.names(self.search(self.db, filter=filter, **dates))),
+                                     sorted(self.names(self.search(self.db_without_views, filter=filter, **dates))))
+
+    def test_distance_filter_only_considers_searched_dates(self):
+        for db in [self.db, self.db_without_views]:
+            results = self.search(db, date='2020-01-01', filter=['distance:<:100000'])
+            self.assertEqual(self.names(results), ['(2019 AB)'])
+
+    def test_views_are_rebuilt_on_reload(self):
+        write_neo_csv(self.neo_data_file, APPROACHES[:2])
+        self.db.load_data()
+        results = self.search(start_date='2020-01-01', end_date='2020-01-10', filter=['is_hazardous:=:True'])
+        self.assertEqual(self.names(results), ['(2019 AA)'])
+        self.assertNotIn(date_to_day('2020-01-02'), self.db.views.orbits_by_distance)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class NEOViews(object):
+    """
+    Object holding materialized views of the Near Earth Objects, precomputed when the database loads its data,
+    that answer the standard README queries with a binary search plus a slice:
+       - hazardous_by_diameter: dict of orbit date to the hazardous Near Earth Objects of that date sorted by diameter
+       - orbits_by_distance: dict of orbit date to the Near Earth Objects of that date sorted by their miss distance
+         on that date
+
+    Every view value is a pair of parallel arrays, the sorted keys and the positions of the Near Earth Objects in
+    the NEODatabase.neos store.
+    """
+
+    Bounds = {
+        '<': lambda keys, value: (0, bisect_left(keys, value)),
+        '<=': lambda keys, value: (0, bisect_right(keys, value)),
+        '=': lambda keys, value: (bisect_left(keys, value), bisect_right(keys, value)),
+        '>': lambda keys, value: (bisect_right(keys, value), len(keys)),
+        '>=': lambda keys, value: (bisect_left(keys, value), len(keys))
+    }
+
+    def __init__(self, neos):
+        """
+        :param neos: list of the unique NearEarthObject instances of the database
+        """
+        orbits_by_date = {}
+        for position, neo in enumerate(neos):
+            for approach_date, distance in zip(neo.approach_dates, neo.approach_distances):
+                orbits_by_date.setdefault(approach_date, []).append((distance, position))
+
+        self.hazardous_by_diameter = {}
+        self.orbits_by_distance = {}
+        for date, orbits in orbits_by_date.items():
+            orbits.sort()
+            self.orbits_by_distance[date] = self.create_view(orbits)
+
+            hazardous = {position for distance, position in orbits if neos[position].is_potentially_hazardous_asteroid}
+            self.hazardous_by_diameter[date] = self.create_view(
+                sorted((neos[position].diameter_min_km, position) for position in hazardous)
+            )
+
+    @staticmethod
+    def create_view(entries):
+        """
+        :param entries: sorted list of (key, position) tuples
+        :return: tuple of the array of keys and the array of positions
+        """
+        return array('d', [key for key, position in entries]), array('I', [position for key, position in entries])
+
+    @staticmethod
+    def select(view, date, filter=None):
+        """
+        Function that finds the positions of a view on a date whose key passes a filter, without copying them
+
+        :param view: dict of orbit date to tuple of keys and positions arrays
+        :param date: int representing the orbit date in days since 1970-01-01
+        :param filter: Filter on the key of the view, or None to select every position of the date
+        :return: memoryview of the positions selected
+        """
+        if date not in view:
+            return ()
+        keys, positions = view[date]
+        if filter is None:
+            return memoryview(positions)
+        start, end = NEOViews.Bounds[filter.operation](keys, filter.value)
+        return memoryview(positions)[start:end]
@@ -1,7 +1,7 @@
 from enum import Enum
 from exceptions import UnsupportedFeature
 import pandas as pd
-from models import NearEarthObject
+from models import NearEarthObject, day_to_date
 
 class OutputFormat(Enum):
     """
@@ -33,7 +33,7 @@ class NEOWriter(object):
         appropriate instance write function
 
         :param format: str representing the OutputFormat
-        :param data: collection of NearEarthObject or OrbitPath results
+        :param data: NEOResultSet or collection of NearEarthObject or OrbitPath results
         :param kwargs: Additional attributes used for formatting output e.g. filename
         :return: bool representing if write successful or not
         """
@@ -41,12 +41,12 @@ class NEOWriter(object):
         # TODO: into instance methods for NEOWriter? Write instance methods that write() can call to do the necessary
         # TODO: output format.
         print(kwargs.items())
-        self.filename = None
+        filename = None
         for key, value in kwargs.items():
             if key == 'output_filename':
-                self.filename = value
-        if not self.filename:
-            self.filename = 'output.csv'
+                filename = value
+        if not filename:
+            filename = 'output.csv'
 
 
         if format in self.output_formats:
@@ -55,7 +55,12 @@ class NEOWriter(object):
                     print(each)
                 result = True
             else:
-                self.save_csv(data, self.filename, isinstance(data[0], NearEarthObject))
+                # A NEOResultSet knows its return object, other results are checked on their first item
+                if hasattr(data, 'return_object'):
+                    is_neo_object = data.return_object == 'NEO'
+                else:
+                    is_neo_object = isinstance(next(iter(data), None), NearEarthObject)
+                self.save_csv(data, filename, is_neo_object)
                 result = True
         else:
             print('invalid format')
@@ -73,7 +78,8 @@ class NEOWriter(object):
                             'diameter_min_km', 'is_potentially_hazardous_asteroid'])
             df.to_csv(filename, index=None)
         else:
+            data_list = []
             for each in data:
-                data_list.append([each.neo_name, each.miss_distance_kilometers, each.close_approach_date])
+                data_list.append([each.neo_name, each.miss_distance_kilometers, day_to_date(each.close_approach_date)])
             df = pd.DataFrame(data_list, columns = ['name', 'miss_distance_kilometers', 'close_approach_date'])
             df.to_csv(filename, index=None)